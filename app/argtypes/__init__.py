@@ -0,0 +1,34 @@
+"""
+Argparse types shared by the command line entry points (REPL, load generator).
+"""
+import argparse
+
+def positive_int(value: str) -> int:
+    """Argparse type for a strictly positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: {value!r}")
+    return number
+
+def non_negative_int(value: str) -> int:
+    """Argparse type for an integer that is zero or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid non-negative integer: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"invalid non-negative integer: {value!r}")
+    return number
+
+def positive_float(value: str) -> float:
+    """Argparse type for a strictly positive, finite number."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive number: {value!r}") from None
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError(f"invalid positive number: {value!r}")
+    return number
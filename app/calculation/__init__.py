@@ -1,5 +1,9 @@
 """
 Calculation module: abstract base class for calculator operations.
+
+`BasicCalculation.evaluate` is the exception-free fast path: it returns a typed
+`CalculationResult` and never raises for domain errors. `BasicCalculation.calculate`
+is kept as a thin string-returning compatibility layer on top of it.
 """
 import logging
 from abc import ABC, abstractmethod
@@ -9,6 +13,68 @@ from app.operations import addition, subtraction, multiplication, division, modu
 # Set up a logger for this module
 logger = logging.getLogger()
 
+# Error codes carried by a failed CalculationResult
+DIVIDE_BY_ZERO = "divide_by_zero"
+MODULO_BY_ZERO = "modulo_by_zero"
+INVALID_OPERATION = "invalid_operation"
+INVALID_OPERAND = "invalid_operand"
+MISSING_OPERAND = "missing_operand"
+PLUGIN_ERROR = "plugin_error"
+
+ERROR_MESSAGES = {
+    DIVIDE_BY_ZERO: "Cannot divide by zero.",
+    MODULO_BY_ZERO: "Cannot modulo by zero.",
+    INVALID_OPERATION: "Invalid operation.",
+    INVALID_OPERAND: "Invalid operand.",
+    MISSING_OPERAND: "Missing operand.",
+    PLUGIN_ERROR: "Plugin operation failed.",
+}
+
+# Dispatch table for the basic two-operand operations
+OPERATIONS = {
+    'add': addition,
+    'subtract': subtraction,
+    'multiply': multiplication,
+    'divide': division,
+    'modulo': modulo,
+    'power': power,
+}
+
+# Operations that must be checked for a zero divisor before being called (LBYL)
+ZERO_DIVISOR_ERRORS = {
+    'divide': DIVIDE_BY_ZERO,
+    'modulo': MODULO_BY_ZERO,
+}
+
+class CalculationResult:
+    """Typed outcome of an evaluation: either a value or an error code with a message."""
+    __slots__ = ("value", "error", "message")
+
+    def __init__(self, value=None, error: Union[str, None] = None, message: Union[str, None] = None):
+        self.value = value
+        self.error = error
+        self.message = message
+
+    @classmethod
+    def success(cls, value) -> "CalculationResult":
+        """Build a successful result holding value."""
+        return cls(value)
+
+    @classmethod
+    def failure(cls, error: str, message: Union[str, None] = None) -> "CalculationResult":
+        """Build a failed result for an error code, defaulting to its standard message."""
+        return cls(None, error, ERROR_MESSAGES[error] if message is None else message)
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the evaluation succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is None:
+            return f"CalculationResult(value={self.value!r})"
+        return f"CalculationResult(error={self.error!r}, message={self.message!r})"
+
 class Calculation(ABC):
     """Abstract base class for calculator operations."""
     @abstractmethod
@@ -18,33 +84,31 @@ class Calculation(ABC):
 
 class BasicCalculation(Calculation):
     """Concrete class for basic calculations with logging."""
-    def calculate(self, a: float, b: float, operation: str) -> Union[float, str]:
-        """Perform the operation based on the input, with logging for each operation."""
+    def evaluate(self, a: float, b: float, operation: str) -> CalculationResult:
+        """Perform the operation and return a CalculationResult without raising or logging."""
+        func = OPERATIONS.get(operation)
+        if func is None:
+            return CalculationResult.failure(INVALID_OPERATION)
+        if b == 0 and operation in ZERO_DIVISOR_ERRORS:
+            return CalculationResult.failure(ZERO_DIVISOR_ERRORS[operation])
         try:
-            if operation == 'add':
-                result = addition(a, b)
-            elif operation == 'subtract':
-                result = subtraction(a, b)
-            elif operation == 'multiply':
-                result = multiplication(a, b)
-            elif operation == 'divide':
-                if b == 0:
-                    raise ZeroDivisionError("Cannot divide by zero.")
-                result = division(a, b)
-            elif operation == 'modulo':
-                if b == 0:
-                    raise ZeroDivisionError("Cannot modulo by zero.")
-                result = modulo(a, b)
-            elif operation == 'power':
-                result = power(a, b)
-            else:
-                logger.warning("Invalid operation requested: %s", operation)
-                return "Invalid operation."
-            return result
-
-        except ZeroDivisionError as e:
+            return CalculationResult(func(a, b))
+        except (TypeError, ValueError, ArithmeticError) as e:
+            return CalculationResult.failure(INVALID_OPERAND, str(e))
+
+    def log_failure(self, a: float, b: float, operation: str, result: CalculationResult):
+        """Log a failed CalculationResult at the level the string interface has always used."""
+        if result.error == INVALID_OPERATION:
+            logger.warning("Invalid operation requested: %s", operation)
+        elif result.error in (DIVIDE_BY_ZERO, MODULO_BY_ZERO):
             logger.error("Division or modulo by zero error with operation %s on %s and %s", operation, a, b)
-            return str(e)
-        except Exception as e:
-            logger.exception("An error occurred while performing the %s operation: %s", operation, e)
-            return str(e)
+        else:
+            logger.error("An error occurred while performing the %s operation: %s", operation, result.message)
+
+    def calculate(self, a: float, b: float, operation: str) -> Union[float, str]:
+        """Perform the operation based on the input, with logging for each operation."""
+        result = self.evaluate(a, b, operation)
+        if result.error is None:
+            return result.value
+        self.log_failure(a, b, operation, result)
+        return result.message
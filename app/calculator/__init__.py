@@ -12,6 +12,7 @@ Functions and Functionalities:
     - Supports history management, including saving, loading, clearing, and undoing the last calculation.
     - Loads plugins dynamically to extend supported operations.
     - Logs calculation activity and errors for monitoring and debugging.
+    - Offers `evaluate`, an exception-free path returning a typed `CalculationResult`.
 
 Usage:
     The `Calculator` class can be used in an interactive REPL environment or integrated into other applications 
@@ -21,7 +22,7 @@ Usage:
 import os
 import importlib
 from typing import Union
-from app.calculation import BasicCalculation
+from app.calculation import BasicCalculation, CalculationResult, INVALID_OPERATION, MISSING_OPERAND, PLUGIN_ERROR
 from app.historymanager import HistoryManager
 
 class Calculator:
@@ -40,6 +41,7 @@ class Calculator:
             "modulo": lambda a, b: self.calculation.calculate(a, b, "modulo"),
             "power": lambda a, b: self.calculation.calculate(a, b, "power"),
         }
+        self.basic_operations = dict(self.operations)
         self.load_plugins()
 
     def load_plugins(self):
@@ -52,20 +54,47 @@ class Calculator:
                 if hasattr(module, "plugin"):
                     self.operations.update(module.plugin)
 
+    def evaluate(self, a: float, b: Union[float, None], operation: str) -> CalculationResult:
+        """Calculate the result as a CalculationResult without raising, logging or recording history."""
+        func = self.operations.get(operation)
+        if func is None:
+            return CalculationResult.failure(INVALID_OPERATION)
+        if func is self.basic_operations.get(operation):
+            if b is None:
+                return CalculationResult.failure(MISSING_OPERAND)
+            return self.calculation.evaluate(a, b, operation)
+        try:
+            return CalculationResult(func(a) if b is None else func(a, b))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return CalculationResult.failure(PLUGIN_ERROR, str(e))
+
+    def format_result(self, result: CalculationResult) -> Union[float, str]:
+        """Return the value or the error string the string interface has always produced for a result."""
+        if result.error is None:
+            return result.value
+        if result.error in (PLUGIN_ERROR, MISSING_OPERAND):
+            return f"Error occurred: {result.message}"
+        return result.message
+
+    def log_failure(self, a: float, b: Union[float, None], operation: str, result: CalculationResult):
+        """Log a failed result the way the string interface always has.
+
+        Only failures inside BasicCalculation were ever logged; unknown operations, missing
+        operands and plugin errors were turned into strings without a log record.
+        """
+        if result.error not in (None, INVALID_OPERATION, PLUGIN_ERROR, MISSING_OPERAND):
+            self.calculation.log_failure(a, b, operation, result)
+
     def calculate_and_log(self, a: float, b: Union[float, None], operation: str) -> Union[float, str]:
         """Calculate the result, log the operation in history, and return the result or error."""
-        func = self.operations.get(operation)
-        
-        # Call the operation based on single or double argument requirements
-        if func:
-            try:
-                result = func(a) if b is None else func(a, b)
-                entry = f"{operation}({a}) = {result}" if b is None else f"{a} {operation} {b} = {result}"
-                self.history_manager.add_to_history(entry)
-                return result
-            except Exception as e:
-                return f"Error occurred: {str(e)}"
-        return "Invalid operation."
+        result = self.evaluate(a, b, operation)
+        output = self.format_result(result)
+        if result.error in (INVALID_OPERATION, PLUGIN_ERROR, MISSING_OPERAND):
+            return output
+        self.log_failure(a, b, operation, result)
+        entry = f"{operation}({a}) = {output}" if b is None else f"{a} {operation} {b} = {output}"
+        self.history_manager.add_to_history(entry)
+        return output
 
     def get_history(self) -> list:
         """Return the calculation history."""
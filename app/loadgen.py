@@ -0,0 +1,267 @@
+"""
+Synthetic load generator for soak testing the calculator.
+
+Drives `Calculator` and `HistoryManager` the way the REPL does (typed evaluation, history
+append, logging, periodic CSV saves) with a configurable operation mix, operand
+distribution, error ratio and save interval, for a fixed duration or operation count.
+Every report interval it prints throughput, latency percentiles, RSS growth and history
+size, to show where `pd.concat` appends, CSV saves or logging start to dominate.
+
+Usage:
+    python -m app.loadgen --ops 50000 --mix add=4,divide=2,sqrt=1 --error-ratio 0.2 --save-every 1000
+"""
+import os
+import sys
+import math
+import time
+import random
+import logging
+import argparse
+from typing import Callable, Union
+from dotenv import load_dotenv
+from app.calculator import Calculator
+from app.historymanager import HistoryManager
+from app.argtypes import positive_int, non_negative_int, positive_float
+
+# Load environment variables
+load_dotenv()
+DEFAULT_LOADGEN_HISTORY_FILE = os.getenv("LOADGEN_HISTORY_FILE", "loadgen_history.csv")
+DEFAULT_LOADGEN_LOG_FILE = os.getenv("LOADGEN_LOG_FILE", "loadgen.log")
+
+DISTRIBUTIONS = ("uniform", "normal", "lognormal", "int")
+
+# Exponent range for successful power operations, keeping results real and finite
+POWER_MAX_EXPONENT = 3.0
+
+# Operands that make an operation fail through its own error path
+OVERFLOW_OPERANDS = (1e10, 1e3)
+
+REPORT_COLUMNS = ("elapsed_s", "ops", "ops_per_s", "errors", "p50_us", "p95_us", "p99_us",
+                  "rss_mb", "rss_growth_mb", "history_rows", "history_kb", "save_ms")
+
+def parse_mix(text: str) -> dict:
+    """Parse an operation mix such as 'add=3,divide=1,sqrt' into a name -> weight dict."""
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+        if mix[name.strip()] < 0:
+            raise ValueError(f"Negative weight for operation {name.strip()}")
+    if not mix or not any(mix.values()):
+        raise ValueError("Operation mix must contain at least one positive weight")
+    return mix
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def current_rss() -> int:
+    """Return the resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):  # pragma: no cover
+        # Not Linux: fall back to the peak RSS, reported in KiB on Linux/BSD and bytes on macOS
+        import resource  # pylint: disable=import-outside-toplevel
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+class LoadGenerator:
+    """Class that drives a Calculator and HistoryManager with a synthetic workload and reports on it."""
+
+    def __init__(self, mix: dict, distribution: str = "uniform", scale: float = 100.0,
+                 error_ratio: float = 0.0, save_every: int = 0,
+                 history_file: str = DEFAULT_LOADGEN_HISTORY_FILE, seed: Union[int, None] = None,
+                 overwrite: bool = False):
+        """Initialize the generator with its workload settings and a fresh, empty history.
+
+        An existing history_file is only replaced when overwrite is True.
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {distribution}, expected one of {', '.join(DISTRIBUTIONS)}")
+        if not 0.0 <= error_ratio <= 1.0:
+            raise ValueError("Error ratio must be between 0 and 1")
+        if save_every < 0:
+            raise ValueError("Save interval must be 0 (never) or a positive number of operations")
+        if os.path.exists(history_file) and not overwrite:
+            raise ValueError(f"History file {history_file} already exists, use overwrite to replace it")
+        self.calc = Calculator()
+        unknown = [name for name in mix if name not in self.calc.operations]
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {', '.join(unknown)}")
+
+        self.history_manager = HistoryManager(history_file=history_file)
+        if overwrite:
+            self.history_manager.clear_history()
+        self.calc.history_manager = self.history_manager
+        self.operations = list(mix)
+        self.weights = list(mix.values())
+        self.distribution = distribution
+        self.scale = scale
+        self.error_ratio = error_ratio
+        self.save_every = save_every
+        self.rng = random.Random(seed)
+
+    def operand(self) -> float:
+        """Draw one operand from the configured distribution."""
+        if self.distribution == "normal":
+            return self.rng.gauss(0.0, self.scale)
+        if self.distribution == "lognormal":
+            return self.rng.lognormvariate(0.0, 1.0) * self.scale
+        if self.distribution == "int":
+            return float(self.rng.randint(-int(self.scale), int(self.scale)))
+        return self.rng.uniform(-self.scale, self.scale)
+
+    def next_operation(self) -> tuple:
+        """Return the next (a, b, operation), forcing an error with probability error_ratio.
+
+        Forced errors go through the operation's own error path: a zero divisor for divide
+        and modulo, a negative operand for sqrt, an overflowing power, and a non-numeric
+        operand for every other operation.
+        """
+        operation = self.rng.choices(self.operations, self.weights)[0]
+        a = self.operand()
+        b = self.operand() if operation in self.calc.basic_operations else None
+        if self.rng.random() < self.error_ratio:
+            if operation in ("divide", "modulo"):
+                return a, 0.0, operation
+            if operation == "sqrt":
+                return -abs(a) or -1.0, b, operation
+            if operation == "power":
+                return OVERFLOW_OPERANDS[0], OVERFLOW_OPERANDS[1], operation
+            return None, b, operation
+        if operation in ("divide", "modulo") and b == 0:
+            b = 1.0
+        if operation == "sqrt":
+            a = abs(a)
+        if operation == "power":
+            # A positive base and bounded exponent keep the result real and finite
+            a = abs(a) or 1.0
+            b = self.rng.uniform(-POWER_MAX_EXPONENT, POWER_MAX_EXPONENT)
+        return a, b, operation
+
+    def history_size(self) -> int:
+        """Return the size of the history CSV file in bytes (0 before the first save)."""
+        try:
+            return os.path.getsize(self.history_manager.history_file)
+        except OSError:
+            return 0
+
+    def run(self, ops: Union[int, None] = None, duration: Union[float, None] = None,
+            report_every: float = 1.0, on_report: Union[Callable[[dict], None], None] = None) -> list:
+        """Run until ops operations or duration seconds, reporting every report_every seconds."""
+        if ops is None and duration is None:
+            raise ValueError("Either ops or duration is required")
+        calc, history_manager = self.calc, self.history_manager
+        reports = []
+        latencies = []
+        done = errors = interval_ops = interval_errors = 0
+        save_ms = 0.0
+        rss_start = current_rss()
+        start = last_report = time.perf_counter()
+        deadline = start + duration if duration is not None else None
+
+        while True:
+            a, b, operation = self.next_operation()
+            began = time.perf_counter()
+            result = calc.evaluate(a, b, operation)
+            calc.log_failure(a, b, operation, result)
+            if not result.ok:
+                interval_errors += 1
+            # Failures are recorded too, exactly as the REPL records them
+            output = calc.format_result(result)
+            entry = f"{operation}({a}) = {output}" if b is None else f"{a} {operation} {b} = {output}"
+            logging.info("User performed calculation: %s", entry)
+            history_manager.add_to_history(entry)
+            now = time.perf_counter()
+            latencies.append(now - began)
+            done += 1
+            interval_ops += 1
+
+            if self.save_every and done % self.save_every == 0:
+                history_manager.save_history()
+                save_ms = max(save_ms, (time.perf_counter() - now) * 1000)
+                now = time.perf_counter()
+
+            finished = (ops is not None and done >= ops) or (deadline is not None and now >= deadline)
+            if finished or now - last_report >= report_every:
+                latencies.sort()
+                errors += interval_errors
+                rss = current_rss()
+                report = {
+                    "elapsed_s": now - start,
+                    "ops": done,
+                    "ops_per_s": interval_ops / (now - last_report) if now > last_report else 0.0,
+                    "errors": errors,
+                    "p50_us": percentile(latencies, 0.50) * 1e6,
+                    "p95_us": percentile(latencies, 0.95) * 1e6,
+                    "p99_us": percentile(latencies, 0.99) * 1e6,
+                    "rss_mb": rss / 2 ** 20,
+                    "rss_growth_mb": (rss - rss_start) / 2 ** 20,
+                    "history_rows": len(history_manager.history),
+                    "history_kb": self.history_size() / 1024,
+                    "save_ms": save_ms,
+                }
+                reports.append(report)
+                if on_report:
+                    on_report(report)
+                latencies = []
+                interval_ops = interval_errors = 0
+                save_ms = 0.0
+                last_report = time.perf_counter()
+            if finished:
+                return reports
+
+def format_report(report: dict) -> str:
+    """Format a report as one fixed-width table row."""
+    return "".join(f"{report[column]:>14.1f}" if isinstance(report[column], float) else f"{report[column]:>14}"
+                   for column in REPORT_COLUMNS)
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options for the load generator."""
+    parser = argparse.ArgumentParser(description="Synthetic load generator and soak test for the calculator.")
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument("--ops", type=positive_int, help="number of operations to run (default 10000)")
+    limit.add_argument("--duration", type=positive_float, help="seconds to run for")
+    parser.add_argument("--mix", default="add,subtract,multiply,divide,modulo,power,sqrt",
+                        help="operation weights, e.g. add=4,divide=2,sqrt=1 (plugins included)")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform", help="operand distribution")
+    parser.add_argument("--scale", type=float, default=100.0, help="operand range or spread")
+    parser.add_argument("--error-ratio", type=float, default=0.0,
+                        help="fraction of operations forced to fail: divide/modulo by zero, sqrt of a negative, "
+                             "power overflow, and a non-numeric operand for every other operation")
+    parser.add_argument("--save-every", type=non_negative_int, default=0,
+                        help="save history every N operations (0 = never)")
+    parser.add_argument("--report-every", type=positive_float, default=1.0, help="seconds between reports")
+    parser.add_argument("--history-file", default=DEFAULT_LOADGEN_HISTORY_FILE, help="history CSV file to write")
+    parser.add_argument("--overwrite", action="store_true", help="replace the history file if it already exists")
+    parser.add_argument("--log-file", default=DEFAULT_LOADGEN_LOG_FILE, help="log file for calculation logging")
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "INFO"), help="logging level")
+    parser.add_argument("--seed", type=int, help="random seed for a reproducible workload")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the load generator from the command line and print a report row per interval."""
+    args = parse_args(argv)
+    logging.basicConfig(
+        filename=args.log_file,
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    try:
+        generator = LoadGenerator(parse_mix(args.mix), distribution=args.distribution, scale=args.scale,
+                                  error_ratio=args.error_ratio, save_every=args.save_every,
+                                  history_file=args.history_file, seed=args.seed, overwrite=args.overwrite)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+    print("".join(f"{column:>14}" for column in REPORT_COLUMNS))
+    ops = 10000 if args.ops is None and args.duration is None else args.ops
+    generator.run(ops=ops, duration=args.duration, report_every=args.report_every,
+                  on_report=lambda report: print(format_report(report), flush=True))
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
 """
 Simple REPL interface for the calculator with plugin support, history management, and logging.
+
+Run with ``--profile`` (or ``PROFILE=1``) to profile the whole session with cProfile, and
+``--profile-memory`` (or ``PROFILE_MEMORY=1``) to also trace allocations with tracemalloc.
 """
 import os
 import logging
+import argparse
+from typing import Union
 from dotenv import load_dotenv
 from app.calculator import Calculator
 from app.historymanager import HistoryManager
+from app.profiler import SessionProfiler, DEFAULT_PROFILE_FILE, DEFAULT_PROFILE_TOP
+from app.argtypes import positive_int
+
+ENV_TRUE = ("1", "true", "yes")
 
 # Load environment variables from .env file
 load_dotenv()
@@ -20,8 +29,10 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-def repl():
+def repl(profiler: Union[SessionProfiler, None] = None):
     """REPL for interacting with the calculator, plugins, and managing history."""
+    profiler = profiler or SessionProfiler()
+    window = None
     calc = Calculator()
     history_manager = HistoryManager()
 
@@ -32,13 +43,38 @@ def repl():
     print("Simple Calculator with Plugin Support.")
     print("Type 'exit' to quit, 'history' to view history, 'menu' to view available commands.")
     print("Commands: 'save_history' to save, 'load_history' to load, 'clear_history' to clear.")
+    print("Profiling: 'profile start' and 'profile stop' to capture a window of activity.")
 
     while True:
-        user_input = input("Enter operation (e.g., 1 1 add or 4 sqrt): ").strip()
+        try:
+            user_input = input("Enter operation (e.g., 1 1 add or 4 sqrt): ").strip()
+        except EOFError:
+            # End of a batch session piped through stdin
+            logging.info("Input ended, leaving the REPL.")
+            break
 
         if user_input.lower() == 'exit':
             logging.info("User exited the REPL.")
             break
+        elif user_input.lower() == 'profile start':
+            if profiler.running:
+                print("Whole-session profiling is running; it is written on exit.")
+            elif window and window.running:
+                print("Profiler already running.")
+            else:
+                window = profiler.window()
+                window.start()
+                logging.info("User started profiling window %s.", window.output_file)
+                print(f"Profiling started, writing to {window.output_file}.")
+        elif user_input.lower() == 'profile stop':
+            summary = window.stop() if window and not profiler.running else None
+            if summary:
+                logging.info("User stopped profiling, profile written to %s", window.output_file)
+                print(summary)
+            elif profiler.running:
+                print("Whole-session profiling is running; it is written on exit.")
+            else:
+                print("Profiler is not running.")
         elif user_input.lower() == 'menu':
             # Display available operations (including plugins)
             print("Available operations:", ', '.join(calc.operations.keys()))
@@ -75,34 +111,60 @@ def repl():
                 logging.info("User attempted to undo, but no operations were available.")
                 print("No operations to undo.")
         else:
+            # Parse the input and handle single- or double-operand operations
+            parts = user_input.split()
             try:
-                # Parse the input and handle single- or double-operand operations
-                parts = user_input.split()
                 if len(parts) == 2:
-                    a, operation = parts
-                    a = float(a)
-                    result = calc.calculate_and_log(a, None, operation)
-                    entry = f"{operation}({a}) = {result}"
+                    a, b, operation = float(parts[0]), None, parts[1]
                 elif len(parts) == 3:
-                    a, b, operation = parts
-                    a = float(a)
-                    b = float(b)
-                    result = calc.calculate_and_log(a, b, operation)
-                    entry = f"{a} {operation} {b} = {result}"
+                    a, b, operation = float(parts[0]), float(parts[1]), parts[2]
                 else:
                     raise ValueError("Invalid input format")
-
-                # Log and add the calculation to history
-                logging.info("User performed calculation: %s", entry)
-                history_manager.add_to_history(entry)
-                print(f"Result: {result}")
-
             except ValueError as e:
                 logging.error("ValueError occurred: %s", e)
                 print(f"Error: {e}")
-            except Exception as e:
-                logging.exception("An unexpected error occurred with input: %s", user_input)
-                print(f"Invalid input or operation: {e}")
+                continue
+
+            # Evaluate on the exception-free path; failures keep their historical string output
+            result = calc.evaluate(a, b, operation)
+            calc.log_failure(a, b, operation, result)
+            output = calc.format_result(result)
+            entry = f"{operation}({a}) = {output}" if b is None else f"{a} {operation} {b} = {output}"
+
+            # Log and add the calculation to history
+            logging.info("User performed calculation: %s", entry)
+            history_manager.add_to_history(entry)
+            print(f"Result: {output}")
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options, falling back to PROFILE* environment variables."""
+    parser = argparse.ArgumentParser(description="Simple calculator REPL with plugin support.")
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_PROFILE_FILE,
+                        default=DEFAULT_PROFILE_FILE if os.getenv("PROFILE", "").lower() in ENV_TRUE else None,
+                        metavar="FILE", help="profile the session with cProfile and write a pstats dump to FILE")
+    parser.add_argument("--profile-memory", action="store_true",
+                        default=os.getenv("PROFILE_MEMORY", "").lower() in ENV_TRUE,
+                        help="also trace allocations with tracemalloc while profiling")
+    # A string default goes through positive_int too, so a bad PROFILE_TOP is reported like a bad option
+    parser.add_argument("--profile-top", type=positive_int, default=os.getenv("PROFILE_TOP", str(DEFAULT_PROFILE_TOP)),
+                        metavar="N", help="number of modules and functions to show in the profile summary")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the REPL, profiling the whole session when requested."""
+    args = parse_args(argv)
+    profiler = SessionProfiler(output_file=args.profile or DEFAULT_PROFILE_FILE,
+                               trace_memory=args.profile_memory, top=args.profile_top)
+    if args.profile:
+        profiler.start()
+    try:
+        repl(profiler)
+    finally:
+        # Also covers a window started with 'profile start' and never stopped
+        for session in [profiler, *profiler.windows]:
+            summary = session.stop()
+            if summary:
+                print(summary)
 
 if __name__ == "__main__":
-    repl()
+    main()
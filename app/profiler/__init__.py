@@ -0,0 +1,200 @@
+"""
+Profiler module: cProfile (and optionally tracemalloc) wrapper for calculator sessions.
+
+The profiler can cover a whole REPL or batch session (``--profile`` / ``PROFILE=1``) or a
+window of activity started and stopped from the REPL; each window is written to its own
+numbered file. On stop it writes a pstats dump and a top-N summary of time and allocations
+grouped per module (``app.calculation``, ``app.historymanager``, ``plugins.sqrt``, ...).
+
+Time and allocations spent in third-party or standard library code are charged to the
+nearest project caller, so pandas work triggered by ``app.historymanager`` is reported
+under ``app.historymanager``.
+"""
+import os
+import io
+import cProfile
+import pstats
+import tracemalloc
+from collections import defaultdict
+from typing import Union
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+DEFAULT_PROFILE_FILE = os.getenv("PROFILE_FILE", "calculator.pstats")
+DEFAULT_PROFILE_TOP = 15
+
+# Stack depth recorded by tracemalloc, deep enough to reach a project frame from pandas internals
+TRACE_FRAMES = 30
+
+# Project root, used to turn file paths into dotted module names
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def project_module(filename: str) -> Union[str, None]:
+    """Return the dotted module name for a file inside the project, or None for any other file."""
+    if filename == "~" or filename.startswith("<"):
+        return None
+    path = os.path.abspath(filename)
+    if not path.startswith(PROJECT_ROOT + os.sep) or "site-packages" in path.split(os.sep):
+        return None
+    name = os.path.splitext(os.path.relpath(path, PROJECT_ROOT))[0].replace(os.sep, ".")
+    return name[:-len(".__init__")] if name.endswith(".__init__") else name
+
+def module_name(filename: str) -> str:
+    """Map a source file path from cProfile or tracemalloc to a module name for grouping."""
+    name = project_module(filename)
+    if name is not None:
+        return name
+    if filename == "~" or filename.startswith("<"):
+        return "<built-in>"
+    parts = os.path.abspath(filename).split(os.sep)
+    if "site-packages" in parts:
+        return parts[parts.index("site-packages") + 1].split(".")[0]
+    return "<stdlib>"
+
+def caller_shares(stats: dict) -> dict:
+    """Map each profiled function to {module: share} of the project modules its time is charged to.
+
+    Project functions are charged to their own module. Other functions split their time
+    between their callers in proportion to the time spent on behalf of each caller, and
+    inherit those callers' shares; functions with no project caller keep their own module.
+    """
+    shares = {}
+
+    def resolve(func, visiting):
+        if func in shares:
+            return shares[func]
+        name = project_module(func[0])
+        if name is not None:
+            shares[func] = {name: 1.0}
+            return shares[func]
+        callers = stats[func][4]
+        weights = {caller: edge[2] for caller, edge in callers.items() if caller in stats and caller not in visiting}
+        total = sum(weights.values())
+        if not total:
+            weights = {caller: edge[1] for caller, edge in callers.items() if caller in weights}
+            total = sum(weights.values())
+        result = defaultdict(float)
+        for caller, weight in weights.items():
+            for module, share in resolve(caller, visiting | {func}).items():
+                result[module] += share * weight / total
+        # Without a project caller the time stays with the function's own module
+        shares[func] = dict(result) if result else {module_name(func[0]): 1.0}
+        return shares[func]
+
+    for func in stats:
+        resolve(func, frozenset())
+    return shares
+
+def frame_module(traceback) -> str:
+    """Return the module of the most recent project frame in a tracemalloc traceback."""
+    for frame in reversed(traceback):
+        name = project_module(frame.filename)
+        if name is not None:
+            return name
+    return module_name(traceback[-1].filename)
+
+class SessionProfiler:
+    """Class to profile a calculator session or a window of it with cProfile and tracemalloc."""
+
+    def __init__(self, output_file: str = DEFAULT_PROFILE_FILE, trace_memory: bool = False,
+                 top: int = DEFAULT_PROFILE_TOP):
+        """Initialize the profiler with the pstats output file, memory tracing flag and summary size."""
+        self.output_file = output_file
+        self.trace_memory = trace_memory
+        self.top = top
+        self.profile = None
+        self.memory_start = None
+        self.memory_diff = []
+        self.windows = []
+
+    @property
+    def running(self) -> bool:
+        """Return True while the profiler is collecting data."""
+        return self.profile is not None
+
+    def window(self) -> "SessionProfiler":
+        """Create a profiler for the next window, writing to a numbered file next to output_file."""
+        root, ext = os.path.splitext(self.output_file)
+        window = SessionProfiler(output_file=f"{root}.window{len(self.windows) + 1}{ext}",
+                                 trace_memory=self.trace_memory, top=self.top)
+        self.windows.append(window)
+        return window
+
+    def start(self):
+        """Start profiling; calling start on a running profiler does nothing."""
+        if self.running:
+            return
+        if self.trace_memory:
+            tracemalloc.start(TRACE_FRAMES)
+            self.memory_start = tracemalloc.take_snapshot()
+        self.memory_diff = []
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self) -> Union[str, None]:
+        """Stop profiling, write the pstats dump and summary, and return the summary text."""
+        if not self.running:
+            return None
+        self.profile.disable()
+        if self.memory_start is not None:
+            memory_end = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            self.memory_diff = memory_end.compare_to(self.memory_start, "traceback")
+            self.memory_start = None
+
+        self.profile.dump_stats(self.output_file)
+        summary = self.summary()
+        with open(f"{self.output_file}.txt", "w", encoding="utf-8") as file:
+            file.write(summary)
+        self.profile = None
+        return summary
+
+    def time_by_module(self) -> list:
+        """Return (module, calls, self time, charged time) tuples sorted by charged time, largest first.
+
+        Charged time is the module's own time plus the third-party and standard library
+        time charged to it as the nearest project caller.
+        """
+        stats = pstats.Stats(self.profile).stats
+        totals = defaultdict(lambda: [0, 0.0, 0.0])
+        for func, share in caller_shares(stats).items():
+            _, calls, self_time, _, _ = stats[func]
+            own = module_name(func[0])
+            totals[own][0] += calls
+            totals[own][1] += self_time
+            for name, fraction in share.items():
+                totals[name][2] += self_time * fraction
+        return sorted(((name, calls, self_time, charged) for name, (calls, self_time, charged) in totals.items()),
+                      key=lambda row: row[3], reverse=True)
+
+    def memory_by_module(self) -> list:
+        """Return (module, allocated blocks, allocated bytes) growth tuples sorted by bytes, largest first.
+
+        Each allocation is charged to the most recent project frame on its traceback.
+        """
+        totals = defaultdict(lambda: [0, 0])
+        for stat in self.memory_diff:
+            name = frame_module(stat.traceback)
+            totals[name][0] += stat.count_diff
+            totals[name][1] += stat.size_diff
+        return sorted(((name, count, size) for name, (count, size) in totals.items()),
+                      key=lambda row: row[2], reverse=True)
+
+    def summary(self) -> str:
+        """Build the top-N text summary of time and allocations per module."""
+        lines = [f"Profile written to {self.output_file}", "",
+                 "Time per module (charged includes library time under the nearest project caller):",
+                 f"{'module':<32}{'calls':>12}{'self s':>12}{'charged s':>12}"]
+        for name, calls, self_time, charged in self.time_by_module()[:self.top]:
+            lines.append(f"{name:<32}{calls:>12}{self_time:>12.6f}{charged:>12.6f}")
+
+        if self.trace_memory:
+            lines += ["", "Allocation growth per module (charged to the nearest project caller):", f"{'module':<32}{'blocks':>12}{'KiB':>12}"]
+            for name, count, size in self.memory_by_module()[:self.top]:
+                lines.append(f"{name:<32}{count:>12}{size / 1024:>12.1f}")
+
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats("cumulative").print_stats(self.top)
+        lines += ["", f"Top {self.top} functions by cumulative time:", stream.getvalue().strip()]
+        return "\n".join(lines) + "\n"
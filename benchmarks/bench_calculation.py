@@ -0,0 +1,75 @@
+"""
+Benchmark the string-returning calculation path against the typed evaluation path.
+
+Each workload mixes successful operations with failing ones (division/modulo by zero
+and invalid operations) at a given error rate, so the cost of error handling shows up.
+
+Calculator.calculate_and_log also appends to a pandas history on every call, so it is
+timed on the first --history-ops operations of each workload with a fresh history.
+
+Usage:
+    python -m benchmarks.bench_calculation [--ops N] [--history-ops N] [--repeat N]
+"""
+import os
+import argparse
+import logging
+import random
+import timeit
+from app.calculation import BasicCalculation
+from app.calculator import Calculator
+from app.historymanager import HistoryManager
+
+ERROR_RATES = (0.0, 0.1, 0.5, 0.9)
+
+GOOD_OPERATIONS = ('add', 'subtract', 'multiply', 'divide', 'modulo', 'power')
+BAD_OPERATIONS = (('divide', 0.0), ('modulo', 0.0), ('unknown', 1.0))
+
+def build_workload(size: int, error_rate: float, seed: int = 0) -> list:
+    """Return a list of (a, b, operation) tuples with roughly error_rate failing entries."""
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(size):
+        a = rng.uniform(-100, 100)
+        if rng.random() < error_rate:
+            operation, b = rng.choice(BAD_OPERATIONS)
+        else:
+            operation, b = rng.choice(GOOD_OPERATIONS), rng.uniform(1, 3)
+        workload.append((a, b, operation))
+    return workload
+
+def run(ops: int, history_ops: int, repeat: int):
+    """Time the string and typed paths for every error rate and print ops/sec."""
+    calculation = BasicCalculation()
+    calculator = Calculator()
+    paths = {
+        "BasicCalculation.calculate": (calculation.calculate, ops),
+        "BasicCalculation.evaluate": (calculation.evaluate, ops),
+        "Calculator.evaluate": (calculator.evaluate, ops),
+        "Calculator.calculate_and_log": (calculator.calculate_and_log, min(ops, history_ops)),
+    }
+
+    def reset_history():
+        # Never touch a real history file; only the in-memory DataFrame is used
+        calculator.history_manager = HistoryManager(history_file=os.devnull)
+
+    print(f"{'error rate':>10}  {'path':<30}{'ops':>10}{'ops/sec':>14}")
+    for error_rate in ERROR_RATES:
+        workload = build_workload(ops, error_rate)
+        for name, (func, size) in paths.items():
+            def loop(func=func, workload=workload[:size]):
+                for a, b, operation in workload:
+                    func(a, b, operation)
+            best = min(timeit.repeat(loop, setup=reset_history, number=1, repeat=repeat))
+            print(f"{error_rate:>10.0%}  {name:<30}{size:>10}{size / best:>14,.0f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark calculation error paths.")
+    parser.add_argument("--ops", type=int, default=100_000, help="operations per workload")
+    parser.add_argument("--history-ops", type=int, default=5_000,
+                        help="operations per workload for calculate_and_log, which grows a history")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    # Errors are logged by the string path; keep that cost but send it nowhere
+    logging.basicConfig(handlers=[logging.NullHandler()], level=logging.INFO)
+    run(args.ops, args.history_ops, args.repeat)
@@ -7,7 +7,9 @@ invalid operations, and unexpected exceptions.
 """
 
 import pytest
-from app.calculation import BasicCalculation
+from app.calculation import (
+    BasicCalculation, CalculationResult, DIVIDE_BY_ZERO, MODULO_BY_ZERO, INVALID_OPERATION, INVALID_OPERAND
+)
 
 # Test valid calculations
 @pytest.mark.parametrize("a, b, operation, expected", [
@@ -90,3 +92,54 @@ def test_calculation_unexpected_exception(a, b, operation):
     result = calc.calculate(a, b, operation)
     # Check that result is a string message and not a numeric value
     assert isinstance(result, str) and not result.isdigit()
+
+# Test the exception-free typed evaluation path
+@pytest.mark.parametrize("a, b, operation, expected", [
+    (1, 1, 'add', 2),
+    (10, 2, 'divide', 5),
+    (2, 3, 'power', 8)
+])
+def test_evaluate_success(a, b, operation, expected):
+    """
+    Test that evaluate returns a successful CalculationResult holding the value.
+    """
+    result = BasicCalculation().evaluate(a, b, operation)
+    assert result.ok and result.error is None
+    assert result.value == expected
+
+@pytest.mark.parametrize("a, b, operation, error, message", [
+    (10, 0, 'divide', DIVIDE_BY_ZERO, "Cannot divide by zero."),
+    (5, 0, 'modulo', MODULO_BY_ZERO, "Cannot modulo by zero."),
+    (1, 1, 'invalid', INVALID_OPERATION, "Invalid operation."),
+])
+def test_evaluate_domain_errors(a, b, operation, error, message):
+    """
+    Test that domain errors come back as error codes instead of being raised.
+    """
+    result = BasicCalculation().evaluate(a, b, operation)
+    assert not result.ok
+    assert result.value is None
+    assert (result.error, result.message) == (error, message)
+
+@pytest.mark.parametrize("a, b, operation", [
+    (None, 3, 'add'),
+    (10.0, 1000, 'power')  # Overflow
+])
+def test_evaluate_invalid_operand(a, b, operation):
+    """
+    Test that bad operands are reported as INVALID_OPERAND with the underlying message.
+    """
+    result = BasicCalculation().evaluate(a, b, operation)
+    assert result.error == INVALID_OPERAND
+    assert isinstance(result.message, str)
+
+def test_calculation_result_slots():
+    """
+    Test that CalculationResult is slot-based and has readable reprs.
+    """
+    result = CalculationResult.success(4)
+    assert not hasattr(result, "__dict__")
+    assert repr(result) == "CalculationResult(value=4)"
+    assert repr(CalculationResult.failure(DIVIDE_BY_ZERO)) == (
+        "CalculationResult(error='divide_by_zero', message='Cannot divide by zero.')"
+    )
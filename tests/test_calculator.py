@@ -7,6 +7,7 @@ invalid operations, and undo functionality.
 
 import pytest
 from app.calculator import Calculator
+from app.calculation import DIVIDE_BY_ZERO, INVALID_OPERATION, MISSING_OPERAND, PLUGIN_ERROR
 
 # Test valid calculations and history logging
 @pytest.mark.parametrize("a, b, operation, expected", [
@@ -68,3 +69,65 @@ def test_calculator_undo():
 
     assert undo == "5 subtract 3 = 2"
     assert len(calc.get_history()) == 1
+
+# Test the typed evaluation path
+@pytest.mark.parametrize("a, b, operation, expected", [
+    (1, 1, 'add', 2),
+    (16, None, 'sqrt', 4),
+])
+def test_calculator_evaluate_success(a, b, operation, expected):
+    """
+    Test that evaluate returns the value for basic and plugin operations without touching history.
+    """
+    calc = Calculator()
+    result = calc.evaluate(a, b, operation)
+    assert result.ok
+    assert result.value == expected
+    assert calc.get_history() == []
+
+@pytest.mark.parametrize("a, b, operation, error", [
+    (10, 0, 'divide', DIVIDE_BY_ZERO),
+    (1, 1, 'invalid', INVALID_OPERATION),
+    (1, None, 'add', MISSING_OPERAND),
+    (-1, None, 'sqrt', PLUGIN_ERROR),
+])
+def test_calculator_evaluate_errors(a, b, operation, error):
+    """
+    Test that evaluate reports failures as error codes rather than raising.
+    """
+    result = Calculator().evaluate(a, b, operation)
+    assert result.error == error
+    assert result.value is None
+
+def test_calculator_plugin_error_compatibility():
+    """
+    Test that calculate_and_log keeps its string error for failing plugins.
+    """
+    calc = Calculator()
+    assert calc.calculate_and_log(-1, None, 'sqrt') == "Error occurred: math domain error"
+    assert calc.get_history() == []
+
+def test_calculator_missing_operand_compatibility():
+    """
+    Test that calculate_and_log keeps its string error for a basic operation given one operand.
+    """
+    calc = Calculator()
+    result = calc.calculate_and_log(1, None, 'add')
+    assert result == "Error occurred: Missing operand."
+    assert calc.get_history() == []
+
+@pytest.mark.parametrize("a, b, operation, level, message", [
+    (10, 0, 'divide', "ERROR", "Division or modulo by zero error with operation divide on 10 and 0"),
+    (1, 1, 'invalid', None, None),
+    (-1, None, 'sqrt', None, None),
+])
+def test_calculator_log_failure(caplog, a, b, operation, level, message):
+    """
+    Test that failures are logged at the same level and with the same message as before.
+    """
+    calc = Calculator()
+    with caplog.at_level("INFO"):
+        calc.log_failure(a, b, operation, calc.evaluate(a, b, operation))
+    assert [(record.levelname, record.getMessage()) for record in caplog.records] == (
+        [(level, message)] if level else []
+    )
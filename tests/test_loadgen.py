@@ -0,0 +1,165 @@
+"""
+Unit tests for the load generator in the app.loadgen module.
+
+This module contains tests for parsing operation mixes, percentiles, workload
+generation with error injection, and a short run with periodic history saves.
+"""
+
+import os
+import pytest
+from app.calculation import DIVIDE_BY_ZERO, MODULO_BY_ZERO, INVALID_OPERAND, PLUGIN_ERROR
+from app.loadgen import LoadGenerator, parse_mix, parse_args, percentile, format_report, REPORT_COLUMNS
+
+@pytest.mark.parametrize("text, expected", [
+    ("add", {"add": 1.0}),
+    ("add=3, divide=1,sqrt", {"add": 3.0, "divide": 1.0, "sqrt": 1.0}),
+])
+def test_parse_mix(text, expected):
+    """
+    Test that operation mixes are parsed into name -> weight dicts.
+    """
+    assert parse_mix(text) == expected
+
+@pytest.mark.parametrize("text", ["", "add=0", "add=-1"])
+def test_parse_mix_invalid(text):
+    """
+    Test that empty, all-zero or negative mixes are rejected.
+    """
+    with pytest.raises(ValueError):
+        parse_mix(text)
+
+@pytest.mark.parametrize("size, fraction, expected", [
+    (10, 0.5, 5),
+    (10, 0.95, 10),
+    (10, 0.0, 1),
+    (10, 0.25, 3),     # 2.5 must round up, not to even
+    (150, 0.99, 149),  # 148.5 must round up, not to even
+    (150, 1.0, 150),
+])
+def test_percentile(size, fraction, expected):
+    """
+    Test nearest-rank percentiles on a sorted list.
+    """
+    assert percentile(list(range(1, size + 1)), fraction) == expected
+    assert percentile([], fraction) == 0.0
+
+def test_invalid_settings(tmp_path):
+    """
+    Test that unknown operations, distributions and error ratios are rejected.
+    """
+    history_file = str(tmp_path / "history.csv")
+    with pytest.raises(ValueError):
+        LoadGenerator({"unknown": 1.0}, history_file=history_file)
+    with pytest.raises(ValueError):
+        LoadGenerator({"add": 1.0}, distribution="cauchy", history_file=history_file)
+    with pytest.raises(ValueError):
+        LoadGenerator({"add": 1.0}, error_ratio=1.5, history_file=history_file)
+    with pytest.raises(ValueError):
+        LoadGenerator({"add": 1.0}, save_every=-1, history_file=history_file)
+    with pytest.raises(ValueError):
+        LoadGenerator({"add": 1.0}, history_file=history_file).run()
+
+def test_existing_history_file(tmp_path):
+    """
+    Test that an existing history file is only replaced when overwrite is requested.
+    """
+    history_file = tmp_path / "history.csv"
+    history_file.write_text("entry\n1 add 1 = 2\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        LoadGenerator({"add": 1.0}, history_file=str(history_file))
+    assert history_file.exists()
+
+    generator = LoadGenerator({"add": 1.0}, history_file=str(history_file), overwrite=True)
+    assert not history_file.exists()
+    assert generator.history_manager.get_history() == []
+
+@pytest.mark.parametrize("operation, error", [
+    ("divide", DIVIDE_BY_ZERO),
+    ("modulo", MODULO_BY_ZERO),
+    ("power", INVALID_OPERAND),
+    ("add", INVALID_OPERAND),
+    ("multiply", INVALID_OPERAND),
+    ("sqrt", PLUGIN_ERROR),
+])
+def test_forced_errors_use_operation_error_path(tmp_path, operation, error):
+    """
+    Test that forced errors keep the operation and fail through its own error path.
+    """
+    generator = LoadGenerator({operation: 1.0}, error_ratio=1.0, history_file=str(tmp_path / "history.csv"), seed=3)
+    for _ in range(20):
+        a, b, drawn = generator.next_operation()
+        assert drawn == operation
+        assert generator.calc.evaluate(a, b, drawn).error == error
+
+@pytest.mark.parametrize("distribution", ["uniform", "normal", "lognormal", "int"])
+def test_power_without_errors(tmp_path, distribution):
+    """
+    Test that error-free power operations give real, finite results for every distribution.
+    """
+    generator = LoadGenerator({"power": 1.0}, distribution=distribution, scale=1000.0,
+                              history_file=str(tmp_path / "history.csv"), seed=4)
+    for _ in range(500):
+        result = generator.calc.evaluate(*generator.next_operation())
+        assert result.ok
+        assert isinstance(result.value, float)
+
+@pytest.mark.parametrize("distribution", ["uniform", "normal", "lognormal", "int"])
+def test_error_ratio_all_failures(tmp_path, distribution):
+    """
+    Test that an error ratio of 1 makes every operation fail, including plugin operations,
+    and that failures are still recorded in history like the REPL does.
+    """
+    generator = LoadGenerator(parse_mix("divide,modulo,sqrt,add,power"), distribution=distribution,
+                              error_ratio=1.0, history_file=str(tmp_path / "history.csv"), seed=1)
+    report = generator.run(ops=200)[-1]
+    assert report["ops"] == 200
+    assert report["errors"] == 200
+    assert report["history_rows"] == 200
+    history = generator.history_manager.get_history()
+    divide_entries = [entry for entry in history if " divide " in entry]
+    sqrt_entries = [entry for entry in history if entry.startswith("sqrt(")]
+    assert divide_entries and all(entry.endswith(" = Cannot divide by zero.") for entry in divide_entries)
+    assert sqrt_entries and all(entry.endswith(" = Error occurred: math domain error") for entry in sqrt_entries)
+
+def test_run_with_saves(tmp_path):
+    """
+    Test a short error-free run: history grows, is saved periodically and reports are complete.
+    """
+    history_file = str(tmp_path / "history.csv")
+    seen = []
+    generator = LoadGenerator(parse_mix("add,divide,sqrt"), save_every=50, history_file=history_file, seed=2)
+    reports = generator.run(ops=120, report_every=60, on_report=seen.append)
+
+    assert reports == seen
+    report = reports[-1]
+    assert set(report) == set(REPORT_COLUMNS)
+    assert report["ops"] == 120
+    assert report["errors"] == 0
+    assert report["history_rows"] == 120
+    assert report["history_kb"] > 0
+    assert os.path.exists(history_file)
+    assert len(format_report(report)) == 14 * len(REPORT_COLUMNS)
+
+@pytest.mark.parametrize("argv", [
+    ["--ops", "-5"],
+    ["--ops", "0"],
+    ["--duration", "-1"],
+    ["--duration", "0"],
+    ["--save-every", "-1"],
+    ["--report-every", "-0.5"],
+    ["--report-every", "nan"],
+])
+def test_parse_args_rejects_invalid_limits(argv):
+    """
+    Test that negative or zero limits and intervals are usage errors.
+    """
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+def test_parse_args_valid_limits():
+    """
+    Test that valid limits and intervals are parsed with their types.
+    """
+    args = parse_args(["--duration", "2.5", "--save-every", "0", "--report-every", "0.5"])
+    assert (args.ops, args.duration, args.save_every, args.report_every) == (None, 2.5, 0, 0.5)
+    assert parse_args(["--ops", "100"]).ops == 100
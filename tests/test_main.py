@@ -0,0 +1,109 @@
+"""
+Unit tests for the command line options and profiling plumbing in the app.main module.
+
+This module contains tests for parsing the profiling options and their environment
+variable fallbacks, and for the profiles written when a session ends.
+"""
+
+import os
+import pytest
+from app import main
+from app.profiler import DEFAULT_PROFILE_FILE, DEFAULT_PROFILE_TOP
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Clear the profiling environment variables for every test."""
+    for name in ("PROFILE", "PROFILE_MEMORY", "PROFILE_TOP"):
+        monkeypatch.delenv(name, raising=False)
+
+@pytest.fixture
+def session_input(monkeypatch):
+    """Feed the given lines to the REPL, then end input like a piped batch session."""
+    def feed(*lines):
+        remaining = list(lines)
+        def fake_input(prompt=""):
+            if not remaining:
+                raise EOFError
+            return remaining.pop(0)
+        monkeypatch.setattr("builtins.input", fake_input)
+    return feed
+
+def test_parse_args_defaults():
+    """
+    Test that profiling is off by default.
+    """
+    args = main.parse_args([])
+    assert args.profile is None
+    assert not args.profile_memory
+    assert args.profile_top == DEFAULT_PROFILE_TOP
+
+@pytest.mark.parametrize("argv, expected", [
+    (["--profile"], DEFAULT_PROFILE_FILE),
+    (["--profile", "session.pstats"], "session.pstats"),
+])
+def test_parse_args_profile_file(argv, expected):
+    """
+    Test --profile with and without a FILE argument.
+    """
+    assert main.parse_args(argv).profile == expected
+
+@pytest.mark.parametrize("value, enabled", [
+    ("1", True),
+    ("TRUE", True),
+    ("yes", True),
+    ("0", False),
+    ("", False),
+    ("off", False),
+])
+def test_parse_args_env_flags(monkeypatch, value, enabled):
+    """
+    Test the truthiness parsing of PROFILE and PROFILE_MEMORY.
+    """
+    monkeypatch.setenv("PROFILE", value)
+    monkeypatch.setenv("PROFILE_MEMORY", value)
+    args = main.parse_args([])
+    assert (args.profile == DEFAULT_PROFILE_FILE) is enabled
+    assert args.profile_memory is enabled
+
+def test_parse_args_profile_top(monkeypatch):
+    """
+    Test that PROFILE_TOP is used as a default and overridden by --profile-top.
+    """
+    monkeypatch.setenv("PROFILE_TOP", "7")
+    assert main.parse_args([]).profile_top == 7
+    assert main.parse_args(["--profile-top", "3"]).profile_top == 3
+
+@pytest.mark.parametrize("value", ["ten", "0", "-2"])
+def test_parse_args_invalid_profile_top(monkeypatch, value):
+    """
+    Test that an invalid PROFILE_TOP is reported as a usage error rather than crashing.
+    """
+    monkeypatch.setenv("PROFILE_TOP", value)
+    with pytest.raises(SystemExit):
+        main.parse_args([])
+
+def test_main_session_profile(tmp_path, session_input, capsys):
+    """
+    Test that a whole-session profile is written on exit and cannot be stopped early.
+    """
+    output_file = str(tmp_path / "session.pstats")
+    session_input("profile start", "profile stop", "1 1 add")
+    main.main(["--profile", output_file])
+
+    out = capsys.readouterr().out
+    assert out.count("Whole-session profiling is running") == 2
+    assert os.path.exists(output_file)
+    assert os.path.exists(f"{output_file}.txt")
+    assert not os.path.exists(str(tmp_path / "session.window1.pstats"))
+
+def test_main_profile_windows(tmp_path, session_input, monkeypatch):
+    """
+    Test that each REPL window is written to its own file, including one left open at exit.
+    """
+    monkeypatch.setattr(main, "DEFAULT_PROFILE_FILE", str(tmp_path / "calculator.pstats"))
+    session_input("profile start", "1 1 add", "profile stop", "profile start", "2 2 multiply")
+    main.main([])
+
+    assert os.path.exists(str(tmp_path / "calculator.window1.pstats"))
+    assert os.path.exists(str(tmp_path / "calculator.window2.pstats"))
+    assert not os.path.exists(str(tmp_path / "calculator.pstats"))
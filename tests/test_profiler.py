@@ -0,0 +1,124 @@
+"""
+Unit tests for the SessionProfiler class in the app.profiler module.
+
+This module contains tests for mapping files to modules, starting and stopping
+a profiling window, and the pstats dump and summary written on stop.
+"""
+
+import os
+import pstats
+import pytest
+from app.calculator import Calculator
+import tracemalloc
+from app.historymanager import HistoryManager
+from app.profiler import SessionProfiler, module_name, caller_shares, frame_module, PROJECT_ROOT
+
+@pytest.mark.parametrize("filename, expected", [
+    (os.path.join(PROJECT_ROOT, "app", "calculation", "__init__.py"), "app.calculation"),
+    (os.path.join(PROJECT_ROOT, "plugins", "sqrt.py"), "plugins.sqrt"),
+    (os.path.join(os.sep, "venv", "lib", "site-packages", "pandas", "core", "frame.py"), "pandas"),
+    ("~", "<built-in>"),
+    ("<frozen importlib._bootstrap>", "<built-in>"),
+])
+def test_module_name(filename, expected):
+    """
+    Test that file paths are grouped under the expected module names.
+    """
+    assert module_name(filename) == expected
+
+def test_stop_without_start():
+    """
+    Test that stopping a profiler that is not running returns None.
+    """
+    profiler = SessionProfiler(output_file="test_profile.pstats")
+    assert not profiler.running
+    assert profiler.stop() is None
+
+def test_profile_window(tmp_path):
+    """
+    Test that a profiling window writes a pstats dump and a per-module summary.
+    """
+    output_file = str(tmp_path / "session.pstats")
+    profiler = SessionProfiler(output_file=output_file, trace_memory=True, top=50)
+    profiler.start()
+    profiler.start()  # Already running, ignored
+    assert profiler.running
+
+    calc = Calculator()
+    calc.calculate_and_log(1, 1, 'add')
+    calc.calculate_and_log(4, None, 'sqrt')
+    summary = profiler.stop()
+
+    assert not profiler.running
+    assert pstats.Stats(output_file).total_calls > 0
+    with open(f"{output_file}.txt", encoding="utf-8") as file:
+        assert file.read() == summary
+    assert "app.calculation" in summary
+    assert "app.historymanager" in summary
+    assert "plugins.sqrt" in summary
+    assert "Allocation growth per module" in summary
+
+def test_window_files(tmp_path):
+    """
+    Test that each window gets its own numbered output file and inherits the settings.
+    """
+    profiler = SessionProfiler(output_file=str(tmp_path / "calculator.pstats"), trace_memory=True, top=5)
+    first, second = profiler.window(), profiler.window()
+    assert first.output_file == str(tmp_path / "calculator.window1.pstats")
+    assert second.output_file == str(tmp_path / "calculator.window2.pstats")
+    assert (second.trace_memory, second.top) == (True, 5)
+    assert profiler.windows == [first, second]
+
+HISTORY_FILE = os.path.join(PROJECT_ROOT, "app", "historymanager", "__init__.py")
+CALCULATION_FILE = os.path.join(PROJECT_ROOT, "app", "calculation", "__init__.py")
+PANDAS_FILE = os.path.join(os.sep, "venv", "lib", "site-packages", "pandas", "core", "frame.py")
+
+def test_caller_shares():
+    """
+    Test that library time is split between project callers by the time spent for each.
+    """
+    history = (HISTORY_FILE, 1, "add_to_history")
+    calculation = (CALCULATION_FILE, 1, "evaluate")
+    concat = (PANDAS_FILE, 1, "concat")
+    helper = (PANDAS_FILE, 2, "helper")
+    orphan = ("~", 0, "<built-in method time>")
+    stats = {
+        history: (1, 1, 0.1, 1.0, {}),
+        calculation: (1, 1, 0.1, 0.5, {}),
+        concat: (4, 4, 1.0, 1.2, {history: (3, 3, 0.75, 0.9), calculation: (1, 1, 0.25, 0.3)}),
+        helper: (2, 2, 0.2, 0.2, {concat: (2, 2, 0.2, 0.2)}),
+        orphan: (1, 1, 0.1, 0.1, {}),
+    }
+    shares = caller_shares(stats)
+    assert shares[history] == {"app.historymanager": 1.0}
+    assert shares[concat] == pytest.approx({"app.historymanager": 0.75, "app.calculation": 0.25})
+    assert shares[helper] == pytest.approx({"app.historymanager": 0.75, "app.calculation": 0.25})
+    assert shares[orphan] == {"<built-in>": 1.0}
+
+def test_frame_module():
+    """
+    Test that allocations are charged to the most recent project frame.
+    """
+    traceback = tracemalloc.Traceback(((PANDAS_FILE, 10), (HISTORY_FILE, 20), (CALCULATION_FILE, 30)))
+    assert frame_module(traceback) == "app.historymanager"
+    assert frame_module(tracemalloc.Traceback(((PANDAS_FILE, 10),))) == "pandas"
+
+def test_history_cost_charged_to_historymanager(tmp_path):
+    """
+    Test that pandas work done for HistoryManager is reported under app.historymanager.
+    """
+    profiler = SessionProfiler(output_file=str(tmp_path / "history.pstats"), trace_memory=True)
+    profiler.start()
+    history_manager = HistoryManager(history_file=str(tmp_path / "history.csv"))
+    for number in range(50):
+        history_manager.add_to_history(f"{number} add 1 = {number + 1}")
+    history_manager.save_history()
+    time_section, memory_section = profiler.stop().split("Top ")[0].split("Allocation growth")
+
+    time_rows = {line.split()[0]: [float(value) for value in line.split()[2:4]]
+                 for line in time_section.splitlines()[4:] if line.strip()}
+    self_time, charged = time_rows["app.historymanager"]
+    assert charged > self_time
+    assert charged > time_rows.get("pandas", [0.0, 0.0])[1]
+    memory_rows = {line.split()[0]: float(line.split()[2]) for line in memory_section.splitlines()[2:] if line.strip()}
+    assert memory_rows["app.historymanager"] > memory_rows.get("pandas", 0.0)